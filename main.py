@@ -1,96 +1,313 @@
 # main.py
 
 import hashlib
-from copy import copy
+from collections.abc import Callable, Iterable, Iterator
 from enum import Enum
-from functools import lru_cache
-from itertools import cycle
-from sys import exit
+from functools import partial
+from sys import exit, intern
 
+import numpy as np
 from faker import Faker
+from numba import int64, njit, types, uint8, uint64
+
+try:
+    import xxhash  # Optional; `FnType.xxh3` is only registered when present
+except ImportError:
+    xxhash = None
+
+
+# Compiled per-byte kernels. `h_val` is kept as `uint64` so arithmetic wraps
+# at 64 bits (as FNV-1a is specified) instead of growing Python big ints.
+# They take the UTF-8 `bytes` as-is, so a hash allocates nothing past the
+# single `key.encode` (no intermediate NumPy view per call).
+_BYTES = types.Bytes(uint8, 1, 'C', readonly=True)
+
+
+@njit(uint64(uint64, uint8), cache=True, nogil=True, inline='always')
+def _fnv1a_step(h_val, b):
+    return (h_val ^ np.uint64(b)) * np.uint64(1099511628211)
+
+
+@njit(uint64(uint64, uint8), cache=True, nogil=True, inline='always')
+def _jenkins_step(h_val, b):
+    h_val += np.uint64(b)
+    h_val += (h_val << np.uint64(10))
+    return h_val ^ (h_val >> np.uint64(6))
+
+
+# The `*_span` loops hash `buf[i:n]`, consuming 8 bytes per trip (one loop
+# branch per 8 bytes) then finishing the tail byte-by-byte; results are
+# identical to the plain per-byte loop. `*_nb` hashes one whole key, while
+# `*_many_nb` hashes a batch of keys joined into one buffer and split at
+# `ends`, so N keys cost one Python-to-native call instead of N.
+
+@njit(uint64(_BYTES, int64, int64), cache=True, nogil=True)
+def _fnv1a_span(buf, i, n):
+    h_val = np.uint64(14695981039346656037)
+    while i + 8 <= n:
+        h_val = _fnv1a_step(h_val, buf[i])
+        h_val = _fnv1a_step(h_val, buf[i + 1])
+        h_val = _fnv1a_step(h_val, buf[i + 2])
+        h_val = _fnv1a_step(h_val, buf[i + 3])
+        h_val = _fnv1a_step(h_val, buf[i + 4])
+        h_val = _fnv1a_step(h_val, buf[i + 5])
+        h_val = _fnv1a_step(h_val, buf[i + 6])
+        h_val = _fnv1a_step(h_val, buf[i + 7])
+        i += 8
+    while i < n:
+        h_val = _fnv1a_step(h_val, buf[i])
+        i += 1
+    return h_val
+
+
+@njit(uint64(_BYTES, int64, int64), cache=True, nogil=True)
+def _jenkins_span(buf, i, n):
+    h_val = np.uint64(0)
+    while i + 8 <= n:
+        h_val = _jenkins_step(h_val, buf[i])
+        h_val = _jenkins_step(h_val, buf[i + 1])
+        h_val = _jenkins_step(h_val, buf[i + 2])
+        h_val = _jenkins_step(h_val, buf[i + 3])
+        h_val = _jenkins_step(h_val, buf[i + 4])
+        h_val = _jenkins_step(h_val, buf[i + 5])
+        h_val = _jenkins_step(h_val, buf[i + 6])
+        h_val = _jenkins_step(h_val, buf[i + 7])
+        i += 8
+    while i < n:
+        h_val = _jenkins_step(h_val, buf[i])
+        i += 1
+    h_val += (h_val << np.uint64(3))
+    h_val ^= (h_val >> np.uint64(11))
+    h_val += (h_val << np.uint64(15))
+    return h_val
+
+
+@njit(uint64(_BYTES, int64, int64), cache=True, nogil=True)
+def _simple_span(buf, i, n):
+    h_val = np.uint64(0)
+    while i < n:
+        h_val += np.uint64(buf[i])
+        i += 1
+    return h_val
+
+
+@njit(uint64(_BYTES), cache=True, nogil=True)
+def _fnv1a_nb(buf):
+    return _fnv1a_span(buf, 0, len(buf))
+
+
+@njit(uint64(_BYTES), cache=True, nogil=True)
+def _jenkins_nb(buf):
+    return _jenkins_span(buf, 0, len(buf))
+
+
+@njit(uint64(_BYTES), cache=True, nogil=True)
+def _simple_nb(buf):
+    return _simple_span(buf, 0, len(buf))
+
+
+@njit(uint64[::1](_BYTES, int64[::1]), cache=True, nogil=True)
+def _fnv1a_many_nb(buf, ends):
+    out, start = np.empty(ends.size, dtype=np.uint64), 0
+    for j in range(ends.size):
+        out[j] = _fnv1a_span(buf, start, ends[j])
+        start = ends[j]
+    return out
+
+
+@njit(uint64[::1](_BYTES, int64[::1]), cache=True, nogil=True)
+def _jenkins_many_nb(buf, ends):
+    out, start = np.empty(ends.size, dtype=np.uint64), 0
+    for j in range(ends.size):
+        out[j] = _jenkins_span(buf, start, ends[j])
+        start = ends[j]
+    return out
+
+
+@njit(uint64[::1](_BYTES, int64[::1]), cache=True, nogil=True)
+def _simple_many_nb(buf, ends):
+    out, start = np.empty(ends.size, dtype=np.uint64), 0
+    for j in range(ends.size):
+        out[j] = _simple_span(buf, start, ends[j])
+        start = ends[j]
+    return out
+
+
+# Single-slot `[last_key, last_hash]` memo per hash function. Repeated keys
+# mostly arrive back-to-back, and an identity check on the one most recent
+# key is far cheaper than an unbounded `lru_cache` hashing every argument.
+_blake2b_last: list = [None, 0]
+_fnv1a_last: list = [None, 0]
+_jenkins_last: list = [None, 0]
+_md5_last: list = [None, 0]
+_sha256_last: list = [None, 0]
+_simple_last: list = [None, 0]
+
+# Digest constructors bound once, so the per-key hashes skip the `hashlib`
+# attribute lookup and share one definition with `hash_many`.
+_blake2b_ctor: Callable = partial(hashlib.blake2b, digest_size=8)
+_md5_ctor: Callable = hashlib.md5
+_sha256_ctor: Callable = hashlib.sha256
 
 
 class HTHashFn:
     class FnType(Enum):
+        blake2b = 'blake2b'
+        builtin = 'builtin'
         fnv1a = 'fnv1a'
         jenkins = 'jenkins'
         md5 = 'md5'
         sha256 = 'sha256'
         simple = 'simple'
+        xxh3 = 'xxh3'
+
+    _DISPATCH: dict[FnType, Callable[[str], int]]  # Populated after class
+    _DIGESTS: dict[FnType, Callable] = {
+        FnType.blake2b: _blake2b_ctor,
+        FnType.md5: _md5_ctor,
+        FnType.sha256: _sha256_ctor,
+    }
+    _KERNELS: dict[FnType, Callable] = {FnType.fnv1a: _fnv1a_many_nb,
+                                        FnType.jenkins: _jenkins_many_nb,
+                                        FnType.simple: _simple_many_nb}
 
-    @classmethod
-    def hash(cls, key: str, hash_fn: FnType = FnType.jenkins):
+    @staticmethod
+    def hash(key: str, hash_fn: FnType = FnType.builtin) -> int:
         """
         @usage:
             hash_value = HashTableHashFn.hash("example_key",
                                               hash_fn=HTHashFn.FnType.md5)
         """
-        match hash_fn:
-            case cls.FnType.fnv1a:
-                return cls.__fnv1a_hash(key)
-            case cls.FnType.jenkins:
-                return cls.__jenkins_hash(key)
-            case cls.FnType.md5:
-                return cls.__md5_hash(key)
-            case cls.FnType.simple:
-                return cls.__simple_hash(key)
-            case cls.FnType.sha256:
-                return cls.__sha256_hash(key)
-            case _:
-                raise ValueError(
-                    f'Invalid hash function: {repr(hash_fn)}\n'
-                    f'[INFO]\tAvailable hash functions:\n'
-                    f'\t\t{'\n\t\t'.join(list(cls.FnType.__members__.keys()))}'
-                )
+        fn = HTHashFn._DISPATCH.get(hash_fn)
+        if fn is None:
+            raise HTHashFn.__invalid_hash_fn(hash_fn)
+        return fn(key)
+
+    @staticmethod
+    def hash_many(keys: Iterable[str],
+                  hash_fn: FnType = FnType.builtin) -> list[int]:
+        """
+        Hash a known batch of keys in one pass, e.g. before bulk inserts.
+        `md5`/`sha256` call straight into `hashlib`, whose OpenSSL backend
+        already picks SHA-NI/AVX2 code at runtime, so consecutive digests
+        stay on the accelerated path without per-key dispatch or memo checks.
+        """
+        digest = HTHashFn._DIGESTS.get(hash_fn)
+        if digest is not None:
+            return [int.from_bytes(digest(k.encode('utf-8')).digest()[:8],
+                                   'little') for k in keys]
+        many = HTHashFn._KERNELS.get(hash_fn)
+        if many is not None:  # One native call for the whole batch
+            encoded = [k.encode('utf-8') for k in keys]
+            ends = np.cumsum([len(b) for b in encoded], dtype=np.int64)
+            return many(b''.join(encoded), ends).tolist()
+        fn = HTHashFn.resolve(hash_fn)
+        return [fn(k) for k in keys]
+
+    @staticmethod
+    def resolve(hash_fn: FnType) -> Callable[[str], int]:
+        """The function behind `hash_fn`, for callers that bind it once"""
+        fn = HTHashFn._DISPATCH.get(hash_fn)
+        if fn is None:
+            raise HTHashFn.__invalid_hash_fn(hash_fn)
+        return fn
+
+    @staticmethod
+    def __invalid_hash_fn(hash_fn) -> ValueError:
+        return ValueError(
+            f'Invalid hash function: {repr(hash_fn)}\n'
+            f'[INFO]\tAvailable hash functions:\n'
+            f'\t\t{'\n\t\t'.join(fn.name for fn in HTHashFn._DISPATCH)}'
+        )
+
+    @staticmethod
+    def __blake2b_hash(key: str) -> int:
+        """BLAKE2b with an 8-byte digest: one C call like `builtin`, but the
+        same value in every process, for when hashes must be reproducible"""
+        last = _blake2b_last
+        if key is last[0]:
+            return last[1]
+        digest = _blake2b_ctor(key.encode('utf-8')).digest()
+        h_val = int.from_bytes(digest, 'little')
+        last[0], last[1] = key, h_val
+        return h_val
+
+    @staticmethod
+    def __builtin_hash(key: str) -> int:
+        """CPython's `str` hash (SipHash in C, cached on the str object) as
+        unsigned 64 bits; salted per process unless `PYTHONHASHSEED` is set"""
+        return hash(key) & 0xFFFFFFFFFFFFFFFF
 
     @staticmethod
-    @lru_cache(maxsize=None)
     def __fnv1a_hash(key: str) -> int:
         """FNV-1a hash algorithm used for better distribution than `djb2`"""
-        h_val = 14695981039346656037
-        for c in key:
-            h_val ^= ord(c)
-            h_val *= 1099511628211
-        return int(h_val)
+        last = _fnv1a_last
+        if key is last[0]:
+            return last[1]
+        h_val = int(_fnv1a_nb(key.encode('utf-8')))
+        last[0], last[1] = key, h_val
+        return h_val
 
     @staticmethod
-    @lru_cache(maxsize=None)
     def __jenkins_hash(key: str) -> int:
         """A non-cryptographic hash function designed for good distribution"""
-        h_val: int = 0
-        for c in key:
-            h_val += ord(c)
-            h_val += (h_val << 10)
-            h_val ^= (h_val >> 6)
-        h_val += (h_val << 3)
-        h_val ^= (h_val >> 11)
-        h_val += (h_val << 15)
-        return int(h_val)
+        last = _jenkins_last
+        if key is last[0]:
+            return last[1]
+        h_val = int(_jenkins_nb(key.encode('utf-8')))
+        last[0], last[1] = key, h_val
+        return h_val
 
     @staticmethod
-    @lru_cache(maxsize=None)
     def __md5_hash(key: str) -> int:
-        """MD5 (Message Digest Algorithm 5)"""
-        md5 = hashlib.md5()
-        md5.update(key.encode('utf-8'))
-        return int((md5.hexdigest()), 16)
+        """MD5 (Message Digest Algorithm 5), truncated to 64 bits"""
+        last = _md5_last
+        if key is last[0]:
+            return last[1]
+        digest = _md5_ctor(key.encode('utf-8')).digest()  # One-shot
+        h_val = int.from_bytes(digest[:8], 'little')  # First 8 bytes
+        last[0], last[1] = key, h_val
+        return h_val
 
     @staticmethod
-    @lru_cache(maxsize=None)
     def __sha256_hash(key: str) -> int:
-        """SHA-256 (Secure Hash Algorithm 256-bit)"""
-        sha256 = hashlib.sha256()
-        sha256.update(key.encode('utf-8'))
-        return int((sha256.hexdigest()), 16)
+        """SHA-256 (Secure Hash Algorithm 256-bit), truncated to 64 bits"""
+        last = _sha256_last
+        if key is last[0]:
+            return last[1]
+        digest = _sha256_ctor(key.encode('utf-8')).digest()  # One-shot
+        h_val = int.from_bytes(digest[:8], 'little')  # First 8 bytes
+        last[0], last[1] = key, h_val
+        return h_val
 
     @staticmethod
-    @lru_cache(maxsize=None)
     def __simple_hash(key: str) -> int:
-        h_val = 0
-        for c in key:  # Convert character to Unicode code point
-            h_val += ord(c)
+        last = _simple_last
+        if key is last[0]:
+            return last[1]
+        h_val = int(_simple_nb(key.encode('utf-8')))
+        last[0], last[1] = key, h_val
         return h_val
 
+    @staticmethod
+    def __xxh3_hash(key: str) -> int:
+        """XXH3-64 from the `xxhash` package: one C call whose SSE2/AVX2/NEON
+        paths mix several lanes at once, and stable across processes"""
+        return xxhash.xxh3_64_intdigest(key.encode('utf-8'))
+
+
+HTHashFn._DISPATCH = {
+    HTHashFn.FnType.blake2b: HTHashFn._HTHashFn__blake2b_hash,
+    HTHashFn.FnType.builtin: HTHashFn._HTHashFn__builtin_hash,
+    HTHashFn.FnType.fnv1a: HTHashFn._HTHashFn__fnv1a_hash,
+    HTHashFn.FnType.jenkins: HTHashFn._HTHashFn__jenkins_hash,
+    HTHashFn.FnType.md5: HTHashFn._HTHashFn__md5_hash,
+    HTHashFn.FnType.sha256: HTHashFn._HTHashFn__sha256_hash,
+    HTHashFn.FnType.simple: HTHashFn._HTHashFn__simple_hash,
+}
+if xxhash is not None:
+    HTHashFn._DISPATCH[HTHashFn.FnType.xxh3] = HTHashFn._HTHashFn__xxh3_hash
+
 
 class HashTable:
     DEFAULT_CAPACITY: int = 16  # capacities = [16, 32, 64]
@@ -99,222 +316,298 @@ class HashTable:
     class FmtEntry(Enum):
         NODE, TREE = 'NODE', 'TREE'
 
-    class Entry:
-        def __init__(self, key: str, val: str) -> None:
-            self.m_key: str = key
-            self.m_val: str = val
-            self.m_next: HashTable.Entry | None = None
-
-    __m_cap: int
+    # Open addressing over three parallel arrays (SoA): slot `i` holds
+    # `__m_hashes[i]`, `__m_keys[i]`, `__m_vals[i]`, and is empty while
+    # `__m_keys[i] is None`. Probing is triangular (`i += 1, 2, 3, ...`),
+    # which visits every slot of a power-of-two table without the long
+    # clusters of linear probing. The hash is kept so resizes never re-hash.
+    __m_cap: int  # Always a power of two, so `h & __m_mask == h % __m_cap`
+    __m_hash: Callable[[str], int]  # Resolved once from `__m_hash_fn`
     __m_hash_fn: HTHashFn.FnType
+    __m_hashes: list[int]
+    __m_keys: list[str | None]
+    __m_mask: int
     __m_size: int
-    __m_table: list[Entry | None]
+    __m_vals: list[str | None]
 
     def __init__(self, capacity: int = DEFAULT_CAPACITY,
-                 hash_fn: HTHashFn.FnType = HTHashFn.FnType.jenkins) -> None:
-        self.__m_cap = capacity
+                 hash_fn: HTHashFn.FnType = HTHashFn.FnType.builtin) -> None:
+        self.__m_cap = 1 << max(capacity - 1, 0).bit_length()  # Next pow2
+        self.__m_mask = self.__m_cap - 1
         self.__m_hash_fn = hash_fn
+        self.__m_hash = HTHashFn.resolve(hash_fn)
         self.__m_size = 0
-        self.__m_table = ([None] * capacity)
+        self.__m_hashes = [0] * self.__m_cap
+        self.__m_keys = [None] * self.__m_cap
+        self.__m_vals = [None] * self.__m_cap
         self.m_entries_read = 0  # Amount of entries visited (insert or update in total in this instance life from start to finish)
         self.m_entries_updated = 0  # Amount of entries visited (insert or update in total in this instance life from start to finish)
-        self.key_freq_dict = dict()
-        self.resize_additive_multiplier = 1
+        self.key_freq_dict: dict[str, int] = dict()
 
     def clear(self) -> None:
-        cur: HashTable.Entry | None
-        for i in range(self.__m_cap):
-            cur = self.__m_table[i]
-            while cur is not None:
-                # Detach current entry from the linked list
-                # Move to the next entry in the linked list
-                cur.m_next, cur = None, cur.m_next
-                self.__m_size -= 1
-            self.__m_table[i] = None  # Reset after clearing current linked list
-        # NOTE: this could fail.
-        assert (self.__m_size == 0 and 'Should visit and clear all entry nodes')
-
-    def get(self, key: str) -> Entry | None:
-        cur: HashTable.Entry | None
-        index = self.hash_key_to_index(key)
-        cur = self.__m_table[index]
-        while cur is not None:
-            if cur.m_key == key:
-                return cur
-            cur = cur.m_next
-
-    def get_bucket_node(self, index: int) -> Entry | None:
-        return copy(self.__m_table[index])
+        # Fresh slot arrays; CPython frees the old ones in C, no per-slot loop
+        self.__m_hashes = [0] * self.__m_cap
+        self.__m_keys = [None] * self.__m_cap
+        self.__m_vals = [None] * self.__m_cap
+        self.__m_size = 0
+
+    def get(self, key: str) -> str | None:
+        return self.__m_vals[self.__probe(key, self.__m_hash(key))]
+
+    def __probe(self, key: str, h_val: int) -> int:
+        """Index of the slot holding `key`, else of the empty slot ending
+        its probe sequence"""
+        hashes, keys, mask = self.__m_hashes, self.__m_keys, self.__m_mask
+        i, step = h_val & mask, 0
+        k = keys[i]
+        while k is not None:
+            if hashes[i] == h_val and k == key:
+                return i
+            step += 1
+            i = (i + step) & mask
+            k = keys[i]
+        return i
+
+    def __probe_depth(self, i: int) -> int:
+        """Probe steps taken from slot `i`'s home slot to reach `i`"""
+        j, depth = self.__m_hashes[i] & self.__m_mask, 0
+        while j != i:
+            depth += 1
+            j = (j + depth) & self.__m_mask
+        return depth
+
+    def __iter_entries(self) -> Iterator[tuple[int, int, str, str]]:
+        """Yield `(index, probe depth, key, val)` for each occupied slot"""
+        for i, (key, val) in enumerate(zip(self.__m_keys, self.__m_vals)):
+            if key is not None:
+                yield i, self.__probe_depth(i), key, val
 
     def get_bucket_as_tuples(self, index: int) -> list[tuple[str, str]] | None:
-        cur = copy(self.__m_table[index])
-        if cur is None:
-            return None
+        """Entries along the probe sequence from home slot `index` up to its
+        first empty slot, i.e. every slot a key homed at `index` may occupy"""
         bucket = list()
-        while cur is not None:
-            bucket.append((cur.m_key, cur.m_val))
-            cur = cur.m_next
-        return bucket
-
-    def bucket_to_reversed(self, index) -> Entry | None:
-        print('reversing....')
-        head = copy(self.__m_table[index])
-        if head is None:
-            return None
-        cur = copy(head)
-        prev: HashTable.Entry | None = None
-
-        while cur is not None:
-            nxt, cur.m_next = cur.m_next, prev
-            prev, cur = cur, nxt
-
-        print('reversing done')
-
-        return copy(prev)
+        i, step = index, 0
+        while self.__m_keys[i] is not None:  # Load < 1: a gap always exists
+            bucket.append((self.__m_keys[i], self.__m_vals[i]))
+            step += 1
+            i = (i + step) & self.__m_mask
+        return bucket if bucket else None
 
     def hash_key_to_index(self, key) -> int:
-        return int(
-            HTHashFn.hash(key=key, hash_fn=self.__m_hash_fn) % self.__m_cap)
+        return self.__m_hash(key) & self.__m_mask
 
-    def insert(self, key: str, val: str) -> None:
+    def insert(self, key: str, val: str, h_val: int | None = None) -> None:
+        """`h_val` may carry a hash precomputed with this table's hash
+        function (see `HTHashFn.hash_many`) to skip hashing here"""
         self.m_entries_read += 1
-        # Check if there's an existing entry with the same key
-        existing_entry = self.get(key)
-        if existing_entry:  # Update the existing entry with the new value
-            existing_entry.m_val = val
-            self.m_entries_updated += 1
-            self.__record_dup_key_freq(key)
-        else:
-            index = self.hash_key_to_index(key)
-            prev, cur = None, self.__m_table[index]
-            while cur:
-                if cur.m_key == key:
-                    if prev:  # If duplicate key is found, remove the existing entry
-                        prev.m_next = cur.m_next
-                    else:  # If duplicate is first entry, update head of the list
-                        self.__m_table[index] = cur.m_next
-                    self.__m_size -= 1
-                    break
-                prev, cur = cur, cur.m_next
-            # Insert the new entry at the beginning of the linked list
-            entry = self.Entry(key, val)
-            entry.m_next = self.__m_table[index]
-            self.__m_table[index] = entry
-            self.__m_size += 1
+        if h_val is None:
+            h_val = self.__m_hash(key)  # Hash once
+        hashes, keys, mask = self.__m_hashes, self.__m_keys, self.__m_mask
+        i, step = h_val & mask, 0
+        k = keys[i]
+        while k is not None:  # Single walk: update on match, else append
+            if hashes[i] == h_val and k == key:
+                self.__m_vals[i] = val
+                self.m_entries_updated += 1
+                self.__record_dup_key_freq(key)
+                return
+            step += 1
+            i = (i + step) & mask
+            k = keys[i]
+        # Claim the empty slot ending the walk. Exact `str` keys are interned
+        # so duplicates share one object; `intern` rejects `str` subclasses
+        hashes[i] = h_val
+        keys[i] = intern(key) if type(key) is str else key
+        self.__m_vals[i] = val
+        self.__m_size += 1
 
         if (self.__m_size / self.__m_cap) > self.LOAD_CAPACITY_THRESHOLD:
             self.__resize()  # Resize if needed
 
+    def bulk_insert(self, items: Iterable[tuple[str, str]],
+                    hashes: Iterable[int] | None = None) -> None:
+        """
+        Insert `(key, val)` pairs exactly as repeated `insert` calls would,
+        with the probe running inline in one frame and table state held in
+        locals. `hashes`, if given, must match `items` one-to-one (as `h_val`
+        does for `insert`); otherwise all keys are hashed up front in one pass.
+        """
+        if hashes is None:
+            items = list(items)
+            hashes = HTHashFn.hash_many((k for k, _ in items),
+                                        self.__m_hash_fn)
+        t_hashes, t_keys = self.__m_hashes, self.__m_keys
+        t_vals, mask, size = self.__m_vals, self.__m_mask, self.__m_size
+        limit = self.__m_cap * self.LOAD_CAPACITY_THRESHOLD
+        freq = self.key_freq_dict
+        n_read = n_updated = 0
+        try:
+            for (key, val), h_val in zip(items, hashes, strict=True):
+                n_read += 1
+                i, step = h_val & mask, 0
+                k = t_keys[i]
+                while k is not None:
+                    if t_hashes[i] == h_val and k == key:
+                        break
+                    step += 1
+                    i = (i + step) & mask
+                    k = t_keys[i]
+                if k is not None:  # Updated an existing entry
+                    t_vals[i] = val
+                    n_updated += 1
+                    freq[key] = freq.get(key, 0) + 1  # Inlined dup count
+                    continue
+                t_hashes[i] = h_val  # Interned as in `insert`
+                t_keys[i] = intern(key) if type(key) is str else key
+                t_vals[i] = val  # Only once the key holds the slot
+                size += 1
+                if size > limit:  # Same threshold as `insert`, sans division
+                    self.__m_size = size
+                    self.__resize()
+                    t_hashes, t_keys = self.__m_hashes, self.__m_keys
+                    t_vals, mask = self.__m_vals, self.__m_mask
+                    limit = self.__m_cap * self.LOAD_CAPACITY_THRESHOLD
+        finally:
+            self.__m_size = size
+            self.m_entries_read += n_read
+            self.m_entries_updated += n_updated
+
     def __record_dup_key_freq(self, key):
-        if self.key_freq_dict.get(key) is None:  # Just for fun
-            self.key_freq_dict[key] = 1
-        else:
-            self.key_freq_dict[key] += 1
+        freq = self.key_freq_dict  # Just for fun; one lookup, one store
+        freq[key] = freq.get(key, 0) + 1
 
     # Inside the HashTable class
     def pretty_print(self) -> None:
         print("HashTable Pretty Print:")
         print(f"\tSize: {self.size()}, Capacity: {self.capacity()}, "
               f"Is Empty: {self.is_empty()}")
-        for i, entry in enumerate(self.__m_table):
-            cur = entry
-            # if cur is not None:
-            #     print(f"\tBucket {i}:")
-            print(f"\tBucket {i}:")
-            while cur is not None:
-                print(f"\t\t\t\t{cur.m_key}: {cur.m_val}")
-                cur = cur.m_next
+        for i, (key, val) in enumerate(zip(self.__m_keys, self.__m_vals)):
+            # if key is not None:
+            #     print(f"\tSlot {i}:")
+            print(f"\tSlot {i}:")
+            if key is not None:
+                print(f"\t\t\t\t{key}: {val}")
 
     def capacity(self) -> int:
         return self.__m_cap
 
     def dbg_visit_all(self, fmt: FmtEntry = FmtEntry.TREE) -> None:
         print(fmt, self.__class__)
-        for e in self.__m_table:
-            HashTablePrinter.print_entry(e, fmt)
+        # Pick the printer once rather than dispatching on `fmt` per entry
+        if fmt == HashTable.FmtEntry.TREE:
+            print_tree = HashTablePrinter.print_tree
+            for _, depth, key, val in self.__iter_entries():
+                print_tree((key, val), depth)
+        elif fmt == HashTable.FmtEntry.NODE:
+            print_node = HashTablePrinter.print_node
+            for _, _, key, val in self.__iter_entries():
+                print_node((key, val))
 
     def describe(self) -> None:
-        HashTablePrinter.describe_hashtable(self, self.__m_table)
+        HashTablePrinter.describe_hashtable(self, self.__iter_entries())
 
     def is_empty(self) -> bool:
-        cur: HashTable.Entry | None
-        return all(cur is None for cur in self.__m_table)
+        return self.__m_size == 0
 
     @staticmethod
-    def print_bucket(bucket: Entry | None) -> None:
+    def print_bucket(bucket: list[tuple[str, str]] | None) -> None:
         if bucket is None:
             return
-        cur = copy(bucket)
-        while cur is not None:
-            print(f'{repr(cur.m_key)}:', repr(cur.m_val))
-            cur = cur.m_next
+        for key, val in bucket:
+            print(f'{repr(key)}:', repr(val))
+
+    def reserve(self, n: int) -> None:
+        """Grow once, up front, so `n` entries fit without further resizes"""
+        needed = int(n / self.LOAD_CAPACITY_THRESHOLD) + 1
+        if needed > self.__m_cap:
+            self.__rehash(1 << (needed - 1).bit_length())  # Next pow2
 
     def size(self) -> int:
         return self.__m_size
 
     def __resize(self):
-        cur: HashTable.Entry | None
-        new_cap = int(
-            self.__m_cap + int(self.__m_cap * self.resize_additive_multiplier))
-        new_table: list[HashTable.Entry | None] = [None] * new_cap
-        for cur in self.__m_table:
-            while cur is not None:  # Re-hash existing entries
-                index = self.hash_key_to_index(cur.m_key)
-                tmp, cur.m_next = cur.m_next, new_table[index]
-                new_table[index], cur = cur, tmp
-        self.__m_table = new_table
+        self.__rehash(self.__m_cap << 1)
+
+    def __rehash(self, new_cap: int) -> None:
+        """Re-place every slot into a table of `new_cap` (a power of two)"""
+        new_mask = new_cap - 1
+        new_hashes: list[int] = [0] * new_cap
+        new_keys: list[str | None] = [None] * new_cap
+        new_vals: list[str | None] = [None] * new_cap
+        for h_val, key, val in zip(self.__m_hashes, self.__m_keys,
+                                   self.__m_vals):
+            if key is not None:  # Re-place using the cached hash
+                i, step = h_val & new_mask, 0
+                while new_keys[i] is not None:
+                    step += 1
+                    i = (i + step) & new_mask
+                new_hashes[i], new_keys[i], new_vals[i] = h_val, key, val
+        self.__m_hashes, self.__m_keys = new_hashes, new_keys
+        self.__m_vals = new_vals
         self.__m_cap = new_cap
+        self.__m_mask = new_mask
 
 
 class HashTablePrinter:
+    _INDENTS: list[str] = ['└─ ']  # `[d]` is `'│   ' * d + '└─ '`
+
     @staticmethod
-    def print_entry(entry: HashTable.Entry | None,
-                    fmt: HashTable.FmtEntry) -> None:
+    def print_entry(entry: tuple[str, str] | None,
+                    fmt: HashTable.FmtEntry, depth: int = 0) -> None:
         if fmt == HashTable.FmtEntry.NODE:
             HashTablePrinter.print_node(entry)
         elif fmt == HashTable.FmtEntry.TREE:
-            HashTablePrinter.print_tree(entry)
+            HashTablePrinter.print_tree(entry, depth)
 
     @staticmethod
-    def print_node(entry: HashTable.Entry | None) -> None:
+    def print_node(entry: tuple[str, str] | None) -> None:
         if entry is not None:
-            print(f'({repr(entry.m_key)}: {repr(entry.m_val)}) -> '
-                  f'{None if entry.m_next is None else ""}')
+            print(f'({HashTablePrinter.format_pair(entry)})')
 
     @staticmethod
-    def print_tree(entry: HashTable.Entry | None, depth: int = 0) -> None:
-        if entry is not None:
-            indent = '│   ' * depth + '└─ '
-            print(f'{indent}{repr(entry.m_key)}: {repr(entry.m_val)}')
-            while entry.m_next is not None:
-                HashTablePrinter.print_tree(entry.m_next, depth + 1)
-                entry = entry.m_next
-        else:
-            return
+    def print_tree(entry: tuple[str, str] | None, depth: int = 0) -> None:
+        if entry is not None:  # One line per entry; probe depth as indent
+            indent = HashTablePrinter.indent(depth)
+            print(f'{indent}{HashTablePrinter.format_pair(entry)}')
+
+    @staticmethod
+    def indent(depth: int) -> str:
+        """Tree prefix for `depth`, built once per depth and then reused"""
+        indents = HashTablePrinter._INDENTS
+        while len(indents) <= depth:
+            indents.append('│   ' + indents[-1])
+        return indents[depth]
 
     @staticmethod
-    def describe_hashtable(ht: HashTable,
-                           entries: list[HashTable.Entry | None]) -> None:
-        buf: list[str] = list()
-        for i, entry in enumerate(entries):
-            cur = entry
-            depth = 0
-            while cur is not None:
-                buf.append(f'{i}->{depth}:\t{cur.m_key}: {cur.m_val}\n')
-                cur = cur.m_next
-                depth += 1
-        print(ht.__class__)
-        print(f'\tsize:{ht.size()}, capacity:{ht.capacity()}, '
-              f'is_empty:{ht.is_empty()}')
-        print('num_entries_read:', ht.m_entries_read, 'num_entries_updated:',
-              ht.m_entries_updated)
-        print('\t[\n' + '\t\t' + '\t\t'.join(
-            buf) + '\t]') if not ht.is_empty() else print('\t[]')
-
-
-def gen_fake_data(fake: Faker, count: int) -> list[HashTable.Entry]:
-    keys, vals = fake.words(count), fake.sentences(count)
-    return [HashTable.Entry(key=k, val=v) for k, v in zip(keys, vals)]
+    def format_pair(entry: tuple[str, str]) -> str:
+        return f'{entry[0]!r}: {entry[1]!r}'
+
+    @staticmethod
+    def describe_hashtable(
+            ht: HashTable,
+            entries: Iterable[tuple[int, int, str, str]]) -> None:
+        """`entries` yields `(index, probe depth, key, val)` per entry"""
+        empty = ht.is_empty()
+        parts: list[str] = [
+            f'{ht.__class__}\n',
+            f'\tsize:{ht.size()}, capacity:{ht.capacity()}, '
+            f'is_empty:{empty}\n',
+            f'num_entries_read: {ht.m_entries_read} '
+            f'num_entries_updated: {ht.m_entries_updated}\n',
+        ]
+        if empty:
+            parts.append('\t[]\n')
+        else:
+            parts.append('\t[\n')
+            parts.extend(f'\t\t{i}->{depth}:\t{key}: {val}\n'
+                         for i, depth, key, val in entries)
+            parts.append('\t]\n')
+        print(''.join(parts), end='')  # One write; `print` reads sys.stdout
+
+
+def gen_fake_data(fake: Faker, count: int) -> list[tuple[str, str]]:
+    """`(key, val)` pairs, ready for `HashTable.bulk_insert`"""
+    return list(zip(fake.words(count), fake.sentences(count)))
 
 
 def main() -> int:
@@ -322,14 +615,16 @@ def main() -> int:
     num_entries = (2 * (10 ** 4))
 
     fake = Faker()
-    ht = HashTable(capacity=ht_capacity, hash_fn=HTHashFn.FnType.sha256)
+    hash_fn = HTHashFn.FnType.sha256
+    ht = HashTable(capacity=ht_capacity, hash_fn=hash_fn)
 
-    fake_entries: list[HashTable.Entry] = gen_fake_data(fake, num_entries)
-    ht_entries: cycle[HashTable.Entry] = cycle(fake_entries)
+    fake_entries: list[tuple[str, str]] = gen_fake_data(fake, num_entries)
+    # Keys are all known up front, so hash them in one batch before inserting
+    fake_hashes = HTHashFn.hash_many((k for k, _ in fake_entries), hash_fn)
+    ht.reserve(len({k for k, _ in fake_entries}))  # Skip all resizes
 
-    for _ in range(num_entries):
-        e = next(ht_entries)
-        ht.insert(key=e.m_key, val=e.m_val)
+    # One generated pair per insert, so the lists feed `bulk_insert` as-is
+    ht.bulk_insert(fake_entries, fake_hashes)
     assert ht.m_entries_read == num_entries
 
     ht.describe()
@@ -340,8 +635,7 @@ def main() -> int:
     print(len(ht.key_freq_dict), ht.key_freq_dict)
 
     index = ht.hash_key_to_index('always')
-    ht.print_bucket(ht.get_bucket_node(index))
-    ht.print_bucket(ht.bucket_to_reversed(index))
+    ht.print_bucket(ht.get_bucket_as_tuples(index))
     # ht.clear()
 
     return 0